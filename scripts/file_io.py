@@ -14,6 +14,7 @@
             - tqdm
             - typing
             - datetime
+            - concurrent.futures
         Internal:
             - None
 
@@ -24,20 +25,31 @@
 =========================================================================================="""
 
 import os
-from re import search, IGNORECASE
+from re import Pattern, compile, IGNORECASE
 from pandas import DataFrame, ExcelWriter, ExcelFile, read_csv, read_excel
 from tqdm import tqdm
 from typing import Tuple, Optional, Dict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Output formats accepted by FileIO.output
+OUTPUT_FORMATS: tuple[str, str] = ("xlsx", "csv")
+
+# File, folder, and sheet name patterns, compiled once for every check_file_exists call
+_INPUT_FILES_PATTERN: Pattern = compile(r"input(?:_+files)?", IGNORECASE)
+_FEDEX_INVOICE_PATTERN: Pattern = compile(r"\b(fedex|invoice)(?:[_\-\s]+(fedex|invoice))?(?:_+data)?\b", IGNORECASE)
+_QBO_PATTERN: Pattern = compile(r"(qbo|quickbooks)", IGNORECASE)
+_CUSTOMER_PATTERN: Pattern = compile(r"customers?", IGNORECASE)
 
 
 def string_normalize(str: str) -> str:
     return str.lower().strip().replace(" ", "_")
 
-def check_file_exists(lst: list, pattern: str) -> Tuple[bool, str] | Tuple[bool, None]:
+def check_file_exists(lst: list, pattern: Pattern) -> Tuple[bool, str] | Tuple[bool, None]:
 
     for file in lst:
-        if search(pattern, string_normalize(file), flags=IGNORECASE):
+        if pattern.search(string_normalize(file)):
             return True, file
     return False, None
 
@@ -111,7 +123,7 @@ class FileIO:
         self.input_files_path: str = os.path.normpath(os.path.join(self.original_path, "input_files"))
 
         self.input_files_exists, self.input_files_folder = check_file_exists(
-            self.all_files_in_root, r"input(?:_+files)?"
+            self.all_files_in_root, _INPUT_FILES_PATTERN
         )
 
     def _validate_input_files_path(self):
@@ -130,7 +142,7 @@ class FileIO:
         self.fedex_invoice_file: str | None
 
         self.fedex_invoice_exists, self.fedex_invoice_file = check_file_exists(self.input_files_lst,
-            r"\b(fedex|invoice)(?:[_\-\s]+(fedex|invoice))?(?:_+data)?\b",
+            _FEDEX_INVOICE_PATTERN,
         )
 
     def _validate_fedex_invoice_path(self):
@@ -159,7 +171,7 @@ class FileIO:
                 self.inv_sheet_names: list = self.inv_sheets.sheet_names
 
                 self.invoice_sheet_exists, self.correct_sheet = check_file_exists(self.inv_sheet_names,
-                    r"\b(fedex|invoice)(?:[_\-\s]+(fedex|invoice))?(?:_+data)?\b",
+                    _FEDEX_INVOICE_PATTERN,
                 )
 
     def _validate_sheets(self):
@@ -173,7 +185,7 @@ class FileIO:
         self.qbo_exists: bool
         self.qbo_file: str | None
 
-        self.qbo_exists, self.qbo_file = check_file_exists(self.input_files_lst, r"(qbo|quickbooks)")
+        self.qbo_exists, self.qbo_file = check_file_exists(self.input_files_lst, _QBO_PATTERN)
 
     def _validate_qbo_path(self):
 
@@ -191,7 +203,7 @@ class FileIO:
         if os.path.isdir(self.customer_path):
             self.customer_lst: list[str] = os.listdir(self.customer_path)
 
-        self.customer_folder_exists, self.customer_folder_name = check_file_exists(self.input_files_lst, r"customers?")
+        self.customer_folder_exists, self.customer_folder_name = check_file_exists(self.input_files_lst, _CUSTOMER_PATTERN)
 
     def _validate_customer_path(self):
 
@@ -233,8 +245,9 @@ class FileIO:
 
             if i == self.fedex_invoice_file:
 
+                # Reuse the workbook opened while validating sheets instead of parsing it again
                 if i.endswith(".xlsx"):
-                    fedex_invoice = read_excel(current_path, sheet_name=self.correct_sheet)
+                    fedex_invoice = self.inv_sheets.parse(sheet_name=self.correct_sheet)
                 elif i.endswith(".csv"):
                     fedex_invoice = read_csv(current_path)
                 else:
@@ -250,24 +263,40 @@ class FileIO:
                 else:
                     raise FileNotFoundError("QBO File must end in .csv or .xlsx")
 
-        # Iterate through each customer in customer directory
+        # Check every customer file type before any reads are started
         for customer in self.customer_lst:
 
-            if customer.endswith(".xlsx"):
-                customer_name = customer.removesuffix(".xlsx")
-                current_customer_path = f"{os.path.join(self.customer_path, customer)}"
-                customer_dct[customer_name] = read_excel(current_customer_path)
-
-            elif customer.endswith(".csv"):
-                customer_name = customer.removesuffix(".csv")
-                current_customer_path = f"{os.path.join(self.customer_path, customer)}"
-                customer_dct[customer_name] = read_csv(current_customer_path)
-            else:
+            if not customer.endswith((".xlsx", ".csv")):
                 raise FileNotFoundError("Customer files must end in '.csv' or '.xlsx'")
 
+        # Customer files are independent, so they are read concurrently; results keep directory order
+        max_workers: int = min(8, len(self.customer_lst))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            for customer_name, customer_df in executor.map(self._read_customer, self.customer_lst):
+                customer_dct[customer_name] = customer_df
+
         return fedex_invoice, qbo, customer_dct
 
-    def output(self, final_df: DataFrame, qbo_found: DataFrame):
+    def _read_customer(self, customer: str) -> Tuple[str, DataFrame]:
+        """
+        Reads a single customer file from the customer folder.
+
+        Parameters:
+            - customer: File name of the customer file, ending in .xlsx or .csv.
+
+        Returns:
+            - Tuple of the customer name (file name without suffix) and its DataFrame.
+        """
+        current_customer_path: str = os.path.join(self.customer_path, customer)
+
+        if customer.endswith(".xlsx"):
+            return customer.removesuffix(".xlsx"), read_excel(current_customer_path)
+
+        return customer.removesuffix(".csv"), read_csv(current_customer_path)
+
+    def output(self, final_df: DataFrame, qbo_found: DataFrame, output_format: str = "xlsx"):
         """
         Outputs resulting Excel file to output folder in original path.
         Creates a new output folder (/root/output_folder) if does not exist.
@@ -275,23 +304,38 @@ class FileIO:
         Parameters:
             - final_df: Pandas DataFrame of fully reconciled data
             - qbo_found: Pandas DataFrame of values found in QBO
+            - output_format: "xlsx" for one workbook with two sheets, or "csv" for two CSV files,
+              which skips the zip/XML work of xlsx. Default is "xlsx".
+
+        Errors Raised:
+            - ValueError if output_format is not "xlsx" or "csv".
         """
-        print("Writing Excel")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError("Output format must be 'xlsx' or 'csv'")
+
+        print("Writing Excel" if output_format == "xlsx" else "Writing CSV")
 
         # root/output_files/
         output_dir: str = os.path.join(self.original_path, "output_files")
 
         os.makedirs(output_dir, exist_ok=True)
 
-        target_path: str = os.path.join(
-            output_dir,
-            f"Reconciled_{datetime.now().strftime('%Y.%m.%d_%H-%M-%S')}")
+        timestamp: str = datetime.now().strftime('%Y.%m.%d_%H-%M-%S')
+        target_path: str = os.path.join(output_dir, f"Reconciled_{timestamp}")
+
+        # root/output_files/Reconciled_timestamp.csv and Found_In_QBO_timestamp.csv
+        if output_format == "csv":
+            final_df.to_csv(f"{target_path}.csv", index=False)
+            qbo_found.to_csv(os.path.join(output_dir, f"Found_In_QBO_{timestamp}.csv"), index=False)
+            return
 
         # root/output_files/filename.xlsx
-        with ExcelWriter(f"{target_path}.xlsx") as writer:
+        # constant_memory is not used: pandas writes cells column by column, which that mode drops
+        with ExcelWriter(f"{target_path}.xlsx", engine="xlsxwriter") as writer:
 
-            final_df.to_excel(writer, sheet_name="Reconciled")
-            qbo_found.to_excel(writer, sheet_name="Found_In_QBO")
+            # The positional index carries no information, so only the data columns are written
+            final_df.to_excel(writer, sheet_name="Reconciled", index=False)
+            qbo_found.to_excel(writer, sheet_name="Found_In_QBO", index=False)
 
 
 if __name__ == "__main__":
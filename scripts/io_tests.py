@@ -13,6 +13,7 @@
             - shutil
             - xlsxwriter
             - tempfile
+            - io
             - pandas
             - csv
         Internal:
@@ -25,7 +26,9 @@ import os
 import shutil
 from xlsxwriter import Workbook
 from tempfile import TemporaryDirectory
-from pandas import DataFrame
+from io import BytesIO
+from pandas import DataFrame, read_csv, read_excel
+from pandas.testing import assert_frame_equal
 import csv
 
 from file_io import FileIO
@@ -38,9 +41,16 @@ class TestIO(unittest.TestCase):
     Test cases to test input functionality and appropriate error catching.
     """
 
+    @classmethod
+    def setUpClass(cls):
+
+        # Workbook bytes per worksheet name, built once and shared by every test in the class
+        cls.excel_bytes = {}
+
     def setUp(self):
 
-        self.temp_dir = TemporaryDirectory()
+        # Keep fixture files in memory-backed /dev/shm when available
+        self.temp_dir = TemporaryDirectory(dir="/dev/shm" if os.access("/dev/shm", os.W_OK) else None)
         self.temp_dir_name = self.temp_dir.name
 
         self.input_files = os.path.join(self.temp_dir_name, "input_files")
@@ -74,11 +84,19 @@ class TestIO(unittest.TestCase):
 
     def create_excel_file(self, file_path, worksheet_name):
 
-        workbook = Workbook(file_path)
-        worksheet = workbook.add_worksheet(worksheet_name)
-        worksheet.write(0, 0, "Sample Data")
-        worksheet.write(1, 0, "More Sample Data")  # Add some data
-        workbook.close()
+        if worksheet_name not in self.excel_bytes:
+
+            buffer = BytesIO()
+            workbook = Workbook(buffer, {"in_memory": True})
+            worksheet = workbook.add_worksheet(worksheet_name)
+            worksheet.write(0, 0, "Sample Data")
+            worksheet.write(1, 0, "More Sample Data")  # Add some data
+            workbook.close()
+
+            self.excel_bytes[worksheet_name] = buffer.getvalue()
+
+        with open(file_path, "wb") as excel_file:
+            excel_file.write(self.excel_bytes[worksheet_name])
 
     """================================= Test __init__ ====================================="""
 
@@ -373,6 +391,66 @@ class TestIO(unittest.TestCase):
             str(error.exception), "Customer files must end in '.csv' or '.xlsx'"
         )
 
+    """================================= Test output ======================================="""
+
+    def test_output_csv(self):
+
+        self.create_excel_file(self.fedex_invoice, worksheet_name="invoice_data")
+        self.create_excel_file(self.qbo, worksheet_name="qbo")
+        self.create_excel_file(self.test_customer, worksheet_name="customer_sheet")
+
+        # Non-default indexes, so a written index column would show up as an extra column
+        final_df = DataFrame({"column1": [0, 1], "column2": ["a", "b"]}, index=[5, 7])
+        qbo_found = DataFrame({"column1": [2], "column2": ["c"]}, index=[3])
+
+        io = FileIO(self.temp_dir_name)
+        io.output(final_df, qbo_found, "csv")
+
+        output_files = sorted(os.listdir(self.output_files))
+
+        self.assertEqual(len(output_files), 2)
+        self.assertTrue(output_files[0].startswith("Found_In_QBO_") and output_files[0].endswith(".csv"))
+        self.assertTrue(output_files[1].startswith("Reconciled_") and output_files[1].endswith(".csv"))
+
+        assert_frame_equal(read_csv(os.path.join(self.output_files, output_files[1])), final_df.reset_index(drop=True))
+        assert_frame_equal(read_csv(os.path.join(self.output_files, output_files[0])), qbo_found.reset_index(drop=True))
+
+    def test_output_xlsx(self):
+
+        self.create_excel_file(self.fedex_invoice, worksheet_name="invoice_data")
+        self.create_excel_file(self.qbo, worksheet_name="qbo")
+        self.create_excel_file(self.test_customer, worksheet_name="customer_sheet")
+
+        # Non-default indexes, so a written index column would show up as an extra column
+        final_df = DataFrame({"column1": [0, 1], "column2": ["a", "b"]}, index=[5, 7])
+        qbo_found = DataFrame({"column1": [2], "column2": ["c"]}, index=[3])
+
+        io = FileIO(self.temp_dir_name)
+        io.output(final_df, qbo_found)
+
+        output_files = os.listdir(self.output_files)
+
+        self.assertEqual(len(output_files), 1)
+        self.assertTrue(output_files[0].startswith("Reconciled_") and output_files[0].endswith(".xlsx"))
+
+        sheets = read_excel(os.path.join(self.output_files, output_files[0]), sheet_name=None)
+
+        self.assertEqual(list(sheets), ["Reconciled", "Found_In_QBO"])
+        assert_frame_equal(sheets["Reconciled"], final_df.reset_index(drop=True))
+        assert_frame_equal(sheets["Found_In_QBO"], qbo_found.reset_index(drop=True))
+
+    def test_output_format_invalid(self):
+
+        self.create_excel_file(self.fedex_invoice, worksheet_name="invoice_data")
+        self.create_excel_file(self.qbo, worksheet_name="qbo")
+        self.create_excel_file(self.test_customer, worksheet_name="customer_sheet")
+
+        io = FileIO(self.temp_dir_name)
+        with self.assertRaises(ValueError) as error:
+            io.output(DataFrame(), DataFrame(), "parquet")
+
+        self.assertEqual(str(error.exception), "Output format must be 'xlsx' or 'csv'")
+
     """=========================================================================================="""
 
 
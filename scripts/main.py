@@ -17,13 +17,15 @@
         4. Extensiv Lookup (Part 2): If still unmatched, searches using receiver details 
            from FedEx (e.g., [Receiver Name], [Receiver Address], [Receiver Company]).
         5. Reconciliation: Updates the [Customer PO #] with the corresponding customer name.
-        6. Output: Exports a reconciled Excel file with the matched values.
+        6. Output: Exports a reconciled Excel file (or CSV files) with the matched values.
 
     Dependencies:
         External:
+            - os
             - pandas
             - tqdm
-            - functools
+            - itertools
+            - concurrent.futures
         Internal:
             - pattern_match
             - processing
@@ -31,13 +33,15 @@
 
 #=========================================================================================="""
 
-from pandas import DataFrame
+import os
+from pandas import DataFrame, concat
 from tqdm import tqdm
-from functools import partial
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 
-from pattern_match import FindCustomerPO, FindPatternMatches, make_final_df
+from pattern_match import FindCustomerPO, run_for_customer, make_final_df
 from processing import convert_floats2ints
-from file_io import FileIO
+from file_io import FileIO, OUTPUT_FORMATS
 
 def main(fedex_invoice: DataFrame, qbo: DataFrame, customer_dct: dict[str,DataFrame] ) -> DataFrame: 
     """
@@ -55,10 +59,10 @@ def main(fedex_invoice: DataFrame, qbo: DataFrame, customer_dct: dict[str,DataFr
 
     print("Pre-Processing")
 
-    convert_floats2ints(fedex_invoice)
-    convert_floats2ints(qbo)
-    for df in customer_dct.values():
-        convert_floats2ints(df)
+    # convert_floats2ints returns a new DataFrame rather than modifying its input
+    fedex_invoice = convert_floats2ints(fedex_invoice)
+    qbo = convert_floats2ints(qbo)
+    customer_dct = {name: convert_floats2ints(df) for name, df in customer_dct.items()}
 
     print("Comparing FedEx Invoice to QBO")
 
@@ -71,21 +75,41 @@ def main(fedex_invoice: DataFrame, qbo: DataFrame, customer_dct: dict[str,DataFr
 
     print("Searching through Extensiv tables for reference and receiver info matches")
 
-    reference_matches = list()
-    receiver_matches = list()
+    reference_match_frames = list()
+    receiver_match_frames = list()
 
-    # Loop through customer Extensiv tables
-    for customer, dataframe in tqdm(customer_dct.items(), smoothing=0.5):
+    # Customer Extensiv tables are independent, so each one is matched in its own process
+    max_workers: int = max(1, min(len(customer_dct), os.cpu_count() or 1))
 
-        PartialFindPatternMatches = partial(FindPatternMatches, fedex_invoice=qbo_not_found)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
 
-        customer_pattern_match = PartialFindPatternMatches(customer, dataframe)
+        results = executor.map(
+            run_for_customer,
+            customer_dct.keys(),
+            customer_dct.values(),
+            repeat(qbo_not_found),
+            repeat(REFERENCE_LST),
+        )
 
-        reference_matches.extend(customer_pattern_match.compare_references(REFERENCE_LST))
+        # Results are yielded in customer order
+        for customer_references, customer_receivers, summary in tqdm(results, total=len(customer_dct), smoothing=0.5):
 
-        receiver_matches.extend(customer_pattern_match.compare_receiver_info())
+            reference_match_frames.append(customer_references)
 
-        print(customer_pattern_match)
+            receiver_match_frames.append(customer_receivers)
+
+            print(summary)
+
+    reference_matches = (
+        concat(reference_match_frames, ignore_index=True)
+        if reference_match_frames
+        else DataFrame(columns=["Reference", "Column", "Customer"])
+    )
+    receiver_matches = (
+        concat(receiver_match_frames, ignore_index=True)
+        if receiver_match_frames
+        else DataFrame(columns=["Address", "Name", "Company", "Customer"])
+    )
 
     final_df = make_final_df(reference_matches, receiver_matches, qbo_not_found)
 
@@ -96,7 +120,13 @@ if __name__ == "__main__":
 
     path = input("File Path (or press Enter for current directory): ")
     io = FileIO(path)
+
+    # Checked before any files are read, so a typo doesn't throw away a finished reconciliation
+    output_format = input("Output Format, xlsx or csv (or press Enter for xlsx): ").strip().lower() or "xlsx"
+    while output_format not in OUTPUT_FORMATS:
+        output_format = input(f"Output Format must be one of {', '.join(OUTPUT_FORMATS)}: ").strip().lower() or "xlsx"
+
     fedex_invoice, qbo, customer_dct = io.get_input()
     final_df, qbo_found = main(fedex_invoice, qbo, customer_dct)
-    io.output(final_df, qbo_found)
+    io.output(final_df, qbo_found, output_format)
     print("Finished")
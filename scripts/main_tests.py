@@ -0,0 +1,89 @@
+"""==========================================================================================
+
+    File:       main_tests.py
+    Description:
+        Contains the unit tests for main.py.
+
+    Dependencies:
+        External:
+            - unittest
+            - contextlib
+            - io
+            - numpy
+            - pandas
+        Internal:
+            - main
+
+=========================================================================================="""
+
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from numpy import nan
+from pandas import DataFrame
+
+from main import main
+
+"""====================================== Setup  ========================================="""
+
+
+class TestMain(unittest.TestCase):
+    """
+    Test cases to pin that main pre-processes every input before matching.
+    """
+
+    def setUp(self):
+
+        self.fedex_invoice = DataFrame(
+            {
+                "Customer PO #": ["PO-1", "PO-9"],
+                "Tracking #": [1.0, 2.0],
+                "Reference": ["X", "3"],
+                "Reference 2": [nan, nan],
+                "Receiver Address": ["1 Main St", "2 Oak Ave"],
+                "Receiver Name": ["Jane Doe", "John Roe"],
+                "Receiver Company": ["Globex", "Initech"],
+            }
+        )
+
+        self.qbo = DataFrame({"Fully_Qualified_Name": ["PO-1"], "Display_Name": ["PO-1"]})
+
+        # Whole-number floats, as read from a column with missing values
+        self.customer_dct = {
+            "Acme": DataFrame(
+                {
+                    "Order Num": [3.0, 4.0, nan],
+                    "ShipTo.Address1": ["9 Far Road", "9 Far Road", "9 Far Road"],
+                    "ShipTo.CompanyName": ["Zed Co", "Zed Co", "Zed Co"],
+                    "ShipTo.Name": ["Nobody", "Nobody", "Nobody"],
+                }
+            )
+        }
+
+    def run_main(self):
+
+        with redirect_stdout(StringIO()):
+            return main(self.fedex_invoice, self.qbo, self.customer_dct)
+
+    """=================================== Test main ======================================"""
+
+    def test_whole_number_floats_arrive_as_ints(self):
+
+        final_df, qbo_found = self.run_main()
+
+        self.assertEqual(final_df["Tracking #"].dtype, "Int64")
+        self.assertEqual(qbo_found["Tracking #"].dtype, "Int64")
+
+    def test_reference_matches_converted_extensiv_column(self):
+
+        # Order Num is compared as 3, not 3.0, so reference 3 is found for Acme
+        final_df, qbo_found = self.run_main()
+
+        self.assertEqual(list(qbo_found["Customer PO #"]), ["PO-1"])
+        self.assertEqual(list(final_df["Customer PO #"]), ["Acme"])
+
+    """=========================================================================================="""
+
+
+if __name__ == "__main__":
+    unittest.main()
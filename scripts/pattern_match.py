@@ -10,6 +10,8 @@
     Dependencies:
         External:
             - re
+            - functools
+            - numpy
             - pandas
             - rapidfuzz
             - typing
@@ -18,11 +20,76 @@
             
 =========================================================================================="""
 
-from re import Pattern, sub, compile, fullmatch
-from pandas import DataFrame, Series, merge, isna, concat
-from rapidfuzz import fuzz
+from re import Pattern, compile
+from functools import lru_cache
+from numpy import ndarray, array, ones, flatnonzero, float32, unique, setdiff1d
+from pandas import DataFrame, Series, CategoricalDtype, merge, concat, factorize
+from rapidfuzz import fuzz, process
 from typing import Optional, Any
 
+# Tokenized patterns for references made of a single character class
+_DIGITS_ONLY: Pattern = compile(r"\d+(\.\d+)?")
+_LETTERS_ONLY: Pattern = compile(r"\w+")
+
+# Letter, number, and whitespace runs rewritten by reg_tokenizer in a single pass, with the
+# replacement for each run indexed by the group that matched it
+_TOKEN_RUNS: Pattern = compile(r"([a-zA-Z]+)|(\d+(?:\.\d+)?)|(\s+)")
+_TOKEN_REPLACEMENTS: tuple[str, str, str] = (r"\w+", r"\d+(\.\d+)?", r"\s+")
+
+
+def normalize_strings(values: list) -> ndarray:
+    """
+    Lowercases and strips a list of values in a single vectorized pass.
+
+    Parameters:
+        - values: List of values to normalize. Non-strings are converted with str().
+    Returns:
+        - NumPy array of normalized strings in the same order.
+    """
+    return Series(values, dtype=object).astype(str).str.lower().str.strip().to_numpy()
+
+
+def normalize_column(column: Series) -> Series:
+    """
+    Lowercases and strips a DataFrame column, normalizing each distinct value only once.
+
+    Parameters:
+        - column: Series to normalize. Non-strings are converted with str().
+    Returns:
+        - Series of normalized strings aligned to the input index.
+    """
+    codes, uniques = factorize(column.astype(str))
+    return Series(normalize_strings(list(uniques))[codes], index=column.index, dtype=object)
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_reference(value_str: str) -> Pattern:
+    """
+    Builds the compiled regex pattern for a reference string. Cached, since invoice
+    references repeat heavily across rows.
+    """
+    # Single-class values reduce to a shared pattern without running the substitutions
+    if value_str.isascii() and value_str.isdigit():
+        return _DIGITS_ONLY
+    if value_str.isascii() and value_str.isalpha():
+        return _LETTERS_ONLY
+
+    tokenized: str = _TOKEN_RUNS.sub(lambda run: _TOKEN_REPLACEMENTS[run.lastindex - 1], value_str)
+
+    return compile(tokenized)
+
+
+def reg_tokenizer(value: Any) -> Pattern:
+    """
+    Converts a value into a regex pattern for reference matching.
+
+    Parameters:
+        - value: Input value to convert. Non-strings are converted with str().
+    Returns:
+        - Compiled regex pattern.
+    """
+    return _tokenize_reference(str(value))
+
 
 class FindCustomerPO:
     """
@@ -56,36 +123,41 @@ class FindCustomerPO:
                 - qbo_found: Records found in QBO.
                 - qbo_not_found: Records not found in QBO.
         """
-        qbo_found: DataFrame = DataFrame()
+        # Shared categories across every key so the join runs on integer codes instead of strings
+        key_values: Series = concat([self.qbo[qbo_key] for qbo_key in qbo_key_lst] + [self.fedex_invoice[fedex_key]])
+        key_dtype: CategoricalDtype = CategoricalDtype(key_values.dropna().unique())
 
-        for qbo_key in qbo_key_lst:
+        fedex_invoice_coded: DataFrame = self.fedex_invoice.assign(_key=self.fedex_invoice[fedex_key].astype(key_dtype).cat.codes)
 
-            merged_df: DataFrame = merge(
-                self.qbo,
-                self.fedex_invoice,
-                left_on=qbo_key,
-                right_on=fedex_key,
-                how="inner",
-            )
+        # Distinct codes found under any QBO key column, excluding missing values (code -1)
+        qbo_codes: Series = concat([self.qbo[qbo_key].astype(key_dtype).cat.codes for qbo_key in qbo_key_lst])
+        qbo_keys: DataFrame = DataFrame({"_key": qbo_codes[qbo_codes >= 0].unique()})
 
-            qbo_found = concat([qbo_found, merged_df], ignore_index=True).drop_duplicates(ignore_index=True)
+        # Single left join, split into found and not found records by the merge indicator
+        merged_df: DataFrame = merge(
+            fedex_invoice_coded,
+            qbo_keys,
+            on="_key",
+            how="left",
+            indicator=True,
+            validate="many_to_one",
+        )
+        found_mask: Series = merged_df["_merge"] == "both"
 
         # Only include columns from fedex_invoice in merged dataset
         fedex_columns: list = list(self.fedex_invoice.columns)
-        qbo_found = qbo_found[fedex_columns]
-
-        self.found_references_unique: set = set(qbo_found["Customer PO #"].unique())
-        self.all_references_unique: set = set(self.fedex_invoice["Customer PO #"])
-        self.unmatched_references: set = (self.all_references_unique - self.found_references_unique)
-
-        # Create new DataFrame with only unique unmatched_references
-        qbo_not_found: DataFrame = DataFrame(list(self.unmatched_references), columns=["Customer PO #"]) 
-
-        # Merge with fedex invoice
-        qbo_not_found = qbo_not_found.merge(
-            self.fedex_invoice,
-            on="Customer PO #",
-            how="left",
+        qbo_found: DataFrame = merged_df.loc[found_mask, fedex_columns].reset_index(drop=True)
+        qbo_not_found: DataFrame = merged_df.loc[~found_mask, fedex_columns].reset_index(drop=True)
+
+        # Reference sets derived from the join codes rather than another pass over the raw key column
+        fedex_codes: ndarray = unique(merged_df["_key"].to_numpy())
+        fedex_codes = fedex_codes[fedex_codes >= 0]
+        found_codes: ndarray = unique(merged_df.loc[found_mask, "_key"].to_numpy())
+
+        self.found_references_unique: set = set(key_dtype.categories[found_codes])
+        self.all_references_unique: set = set(key_dtype.categories[fedex_codes])
+        self.unmatched_references: set = set(
+            key_dtype.categories[setdiff1d(fedex_codes, found_codes, assume_unique=True)]
         )
 
         return (qbo_found, qbo_not_found)
@@ -116,6 +188,18 @@ class FindPatternMatches:
         if not (isinstance(self.extensiv_table, DataFrame) and isinstance(self.fedex_invoice, DataFrame)):
             raise TypeError("Both tables must be DataFrames")
 
+        self._name_norm: str = str(self.name).lower().strip()
+
+        # Stringified head of each Extensiv column, built once and reused for every reference pattern
+        SAMPLE_SIZE: int = 25
+        self._sample: dict[str, ndarray] = {
+            column: self.extensiv_table[column].head(SAMPLE_SIZE).astype(str).to_numpy()
+            for column in self.extensiv_table.columns
+        }
+
+        # Matching Extensiv columns per pattern string, shared across every reference column
+        self._pattern_to_cols: dict[str, Optional[set[str]]] = dict()
+
     def append_match( self, reference_match: str | None = None, receiver_match: dict[str, Any] | None = None):
         """
         Stores matched reference and receiver information during comparisons.
@@ -148,49 +232,33 @@ class FindPatternMatches:
             f"{'-' * 70 }\n"
         )
 
-    def __reg_tokenizer(self, value: str) -> Pattern:
-        """
-        Converts a string value into a regex pattern for reference matching.
-
-        Parameters:
-            - value: Input string to convert.
-        Returns:
-            - Compiled regex pattern.
-        """
-        with_letters: str = sub(r"[a-zA-Z]+", r"\\w+", str(value))
-        with_numbers: str = sub(r"\d+(\.\d+)?", r"\\d+(\\.\\d+)?", with_letters)
-        with_spaces: str = sub(r"\s+", r"\\s+", with_numbers)
-
-        final: Pattern = compile(with_spaces)
-        return final
-
-    def __find_matching_columns(self, reference_pattern: Series,) -> Optional[set[str]]: 
+    def __find_matching_columns(self, reference_pattern: Pattern) -> Optional[set[str]]: 
         """
         Identifies columns in the Extensiv table that contain values matching a given reference pattern.
 
         Parameters:
-            - reference_pattern: Regular expression pattern to search for in Extensiv table columns.
+            - reference_pattern: Compiled regular expression to search for in Extensiv table columns.
         Returns:
             - A set of column names that contain at least one match to the reference pattern.
 
         Notes:
             - The search is limited to the first 25 records in each column for performance reasons.
-            - Future iterations may implement multiprocessing to extend the search range.
+            - Samples are stringified once in __init__, so each check is a plain fullmatch over an array.
+            - Results are cached by pattern string, so repeated reference shapes are only scanned once.
         """
-        SAMPLE_SIZE: int = 25
-        columns: set = set()
+        if reference_pattern.pattern in self._pattern_to_cols:
+            return self._pattern_to_cols[reference_pattern.pattern]
 
-        for column in self.extensiv_table.columns:
+        columns: set = set()
 
-            for value in self.extensiv_table[column][:SAMPLE_SIZE]:
+        for column, sample in self._sample.items():
 
-                if fullmatch(reference_pattern, str(value)):
+            if any(map(reference_pattern.fullmatch, sample)):
+                columns.add(column.strip())
 
-                    columns.add(column.strip())
-                    break
+        self._pattern_to_cols[reference_pattern.pattern] = columns if columns else None
 
-        if columns:
-            return columns
+        return self._pattern_to_cols[reference_pattern.pattern]
 
     def __find_extensiv_reference_columns(self, reference_column_name: str) -> dict[str, set]:
         """
@@ -200,202 +268,280 @@ class FindPatternMatches:
             - reference_column_name: Column in the FedEx Invoice to compare against Extensiv values.
         Returns:
             - A dictionary where keys are reference values, and values are sets of matching Extensiv columns.
+
+        Notes:
+            - Missing and repeated references are dropped first, so each distinct reference is tokenized
+              and looked up only once.
         """
         match_dct: dict = dict()
 
-        for i, v in enumerate(self.fedex_invoice[reference_column_name]):
+        references: list = self.fedex_invoice[reference_column_name].dropna().astype(str).drop_duplicates().tolist()
+        reference_patterns: list = [reg_tokenizer(reference) for reference in references]
+
+        for reference, pattern in zip(references, reference_patterns):
 
-            pattern = self.fedex_invoice[self.reference_pattern_column][i]
             cols = self.__find_matching_columns(pattern)
 
-            if cols is not None and not isna(v):
-                match_dct[str(v)] = cols
+            if cols is not None:
+                match_dct[reference] = cols
 
         return match_dct
 
-    def compare_references(self, reference_column_lst: list) -> list[dict[str, str]]: 
+    def compare_references(self, reference_column_lst: list) -> DataFrame: 
         """
         Compares reference values from the FedEx invoice against values in matched Extensiv table columns.
 
         Parameters:
             - reference_column_lst: List of FedEx Invoice columns to compare against Extensiv data.
         Returns:
-            - A list of dictionaries containing matched reference details.
+            - A DataFrame containing matched reference details.
 
         Notes:
             - Performs both exact and fuzzy matching.
-            - Matches are stored in a list of dictionaries with Reference, Column, and Customer information.
+            - Matches are accumulated column-wise and returned with Reference, Column, and Customer columns.
         """
 
         FUZZY_SCORE: float = 75.0
-        match_lst: list = list()
+        matched_references: list = list()
+        matched_columns: list = list()
         unique_references: set = set()
 
-        for reference_column in reference_column_lst:
+        # Normalized value sets per Extensiv column, built on first use and shared by all references
+        column_values: dict[str, set[str]] = dict()
 
-            self.reference_pattern_column: str = reference_column + "_Pattern"
-            self.fedex_invoice[self.reference_pattern_column] = self.fedex_invoice[reference_column].apply(self.__reg_tokenizer) 
+        for reference_column in reference_column_lst:
 
             reference_columns: dict = self.__find_extensiv_reference_columns(reference_column)
 
+            # Fuzzy match check against the customer name, scored for every reference in one call
+            fuzzy_hits: list = process.extract(
+                self._name_norm,
+                [str(reference).lower().strip() for reference in reference_columns],
+                scorer=fuzz.partial_ratio,
+                score_cutoff=FUZZY_SCORE,
+                limit=None,
+            )
+            fuzzy_references: set = {choice for choice, score, _ in fuzzy_hits if score > FUZZY_SCORE}
+
             # Iterate through references
             for reference, columns in reference_columns.items():
 
-                # Iterate through each column in Extensiv table
-                for column in self.extensiv_table[list(columns)]:
-
-                    # Iterate through each value in column
-                    for value in self.extensiv_table[column]:
-
-                        value_str = str(value).lower().strip()
-                        reference_str = str(reference).lower().strip()
-
-                        # Exact match check
-                        if value_str == reference_str:
-
-                            if reference not in unique_references:
-                                match_lst.append(
-                                    {
-                                        "Reference": reference,
-                                        "Column": column,
-                                        "Customer": self.name,
-                                    }
-                                )
-                                unique_references.add(reference)
-                                self.append_match(reference_match=reference)
-
-                        # Fuzzy match check
-                        elif (fuzz.partial_ratio(reference_str, str(self.name).lower().strip()) > FUZZY_SCORE
-                              and reference not in unique_references):
-                            match_lst.append(
-                                {
-                                    "Reference": reference,
-                                    "Column": column,
-                                    "Customer": self.name,
-                                }
-                            )
-                            unique_references.add(reference)
-                            self.append_match(reference_match=reference)
+                if reference in unique_references:
+                    continue
 
-            self.fedex_invoice = self.fedex_invoice.drop(columns=self.reference_pattern_column)
+                reference_str: str = str(reference).lower().strip()
+                matched_column: str | None = None
 
-        return match_lst
+                if reference_str in fuzzy_references:
+                    matched_column = list(columns)[0]
+
+                # Exact match check against the normalized values of each matched Extensiv column
+                else:
+                    for column in list(columns):
+
+                        if column not in column_values:
+                            column_values[column] = set(
+                                normalize_strings(list(self.extensiv_table[column].astype(str).unique()))
+                            )
+
+                        if reference_str in column_values[column]:
+                            matched_column = column
+                            break
+
+                if matched_column is not None:
+                    matched_references.append(reference)
+                    matched_columns.append(matched_column)
+                    unique_references.add(reference)
+                    self.append_match(reference_match=reference)
+
+        return DataFrame(
+            {
+                "Reference": matched_references,
+                "Column": matched_columns,
+                "Customer": [self.name] * len(matched_references),
+            }
+        )
 
     def __create_extensiv_receiver_info(self):
         """Extracts unique receiver information from the Extensiv table for comparison."""
         extensiv_receiver_info = self.extensiv_table.drop_duplicates(["ShipTo.CompanyName","ShipTo.Name","ShipTo.Address1"])
-        self.extensiv_receiver_lst: list = []
-        for _, row in extensiv_receiver_info.iterrows():
-            entry = {
-                "Receiver Address": row["ShipTo.Address1"],
-                "Receiver Company": row["ShipTo.CompanyName"],
-                "Receiver Name": row["ShipTo.Name"],
-            }
-            self.extensiv_receiver_lst.append(entry)
+        self.extensiv_receiver_info: DataFrame = (
+            extensiv_receiver_info[["ShipTo.Address1", "ShipTo.CompanyName", "ShipTo.Name"]]
+            .rename(
+                columns={
+                    "ShipTo.Address1": "Receiver Address",
+                    "ShipTo.CompanyName": "Receiver Company",
+                    "ShipTo.Name": "Receiver Name",
+                }
+            )
+            .reset_index(drop=True)
+        )
 
     def __create_fedex_invoice_receiver_info(self):
         """Extracts unique receiver information from the FedEx Invoice for comparison."""
         fedex_invoice_info = self.fedex_invoice.drop_duplicates(["Receiver Address", "Receiver Company", "Receiver Name"])
-        self.fedex_invoice_receiver_lst: list = []
-        
-        for _, row in fedex_invoice_info.iterrows():
-            entry = {
-                "Receiver Address": row["Receiver Address"],
-                "Receiver Company": row["Receiver Company"],
-                "Receiver Name": row["Receiver Name"],
-            }
-            self.fedex_invoice_receiver_lst.append(entry)
+        self.fedex_invoice_receiver_info: DataFrame = (
+            fedex_invoice_info[["Receiver Address", "Receiver Company", "Receiver Name"]].reset_index(drop=True)
+        )
 
-    def compare_receiver_info(self) -> list[dict[str, str]]:
+    def compare_receiver_info(self, block_size: Optional[int] = None) -> DataFrame:
         """
         Performs fuzzy matching to compare receiver details between the Extensiv and FedEx Invoice datasets.
 
+        Parameters:
+            - block_size: FedEx receivers scored per block. Default is sized so each score matrix holds at most 1,000,000 cells.
         Returns:
-            - A list of dictionaries containing matched receiver details and customer name.
+            - A DataFrame containing matched receiver details with Address, Name, Company, and Customer columns.
 
         Notes:
-            - Uses token_set_ratio for fuzzy matching.
+            - Uses token_set_ratio for fuzzy matching, scored as whole matrices with process.cdist.
             - All three receiver fields must exceed a fuzzy score of 70 for a match.
+            - Matches are accumulated column-wise, like compare_references.
         """
 
         FUZZY_SCORE: float = 70.0
-        match_lst: list = []
+        CELL_BUDGET: int = 1_000_000
+        matched_addresses: list = list()
+        matched_names: list = list()
+        matched_companies: list = list()
 
         self.__create_extensiv_receiver_info()
         self.__create_fedex_invoice_receiver_info()
 
-        for fedex_receiver in self.fedex_invoice_receiver_lst:
-            fedex_address: str = str(fedex_receiver["Receiver Address"]).lower().strip()
-            fedex_name: str = str(fedex_receiver["Receiver Name"]).lower().strip()
-            fedex_company: str = str(fedex_receiver["Receiver Company"]).lower().strip()
+        # Normalize each receiver field once instead of on every pairwise comparison
+        fedex_addresses: ndarray = normalize_column(self.fedex_invoice_receiver_info["Receiver Address"]).to_numpy()
+        fedex_names: ndarray = normalize_column(self.fedex_invoice_receiver_info["Receiver Name"]).to_numpy()
+        fedex_companies: ndarray = normalize_column(self.fedex_invoice_receiver_info["Receiver Company"]).to_numpy()
+
+        extensiv_addresses: ndarray = normalize_column(self.extensiv_receiver_info["Receiver Address"]).to_numpy()
+        extensiv_names: ndarray = normalize_column(self.extensiv_receiver_info["Receiver Name"]).to_numpy()
+        extensiv_companies: ndarray = normalize_column(self.extensiv_receiver_info["Receiver Company"]).to_numpy()
+
+        # Original field values, read column-wise for building match entries
+        raw_addresses: list = self.fedex_invoice_receiver_info["Receiver Address"].tolist()
+        raw_names: list = self.fedex_invoice_receiver_info["Receiver Name"].tolist()
+        raw_companies: list = self.fedex_invoice_receiver_info["Receiver Company"].tolist()
+
+        field_pairs: list = [
+            (fedex_addresses, extensiv_addresses),
+            (fedex_names, extensiv_names),
+            (fedex_companies, extensiv_companies),
+        ]
+
+        # Receivers identical to an Extensiv receiver on every non-empty field always score 100,
+        # so they are matched with a hash lookup and left out of the score matrices
+        extensiv_keys: set[tuple] = set(zip(extensiv_addresses, extensiv_names, extensiv_companies))
+        matched: ndarray = array(
+            [all(key) and key in extensiv_keys for key in zip(fedex_addresses, fedex_names, fedex_companies)],
+            dtype=bool,
+        )
+        unscored: ndarray = flatnonzero(~matched)
+
+        # Score the remaining FedEx receivers against all Extensiv receivers in blocks to bound the score matrices
+        # Rows per block chosen so each score matrix holds at most CELL_BUDGET cells, whatever the Extensiv size
+        if block_size is None:
+            block_size = max(1, CELL_BUDGET // max(1, len(extensiv_addresses)))
+
+        for start in range(0, len(unscored), block_size):
+
+            block_rows: ndarray = unscored[start:start + block_size]
+            block_matches: ndarray = ones((len(block_rows), len(extensiv_addresses)), dtype=bool)
+
+            for fedex_field, extensiv_field in field_pairs:
+
+                scores: ndarray = process.cdist(
+                    fedex_field[block_rows],
+                    extensiv_field,
+                    scorer=fuzz.token_set_ratio,
+                    score_cutoff=FUZZY_SCORE,
+                    dtype=float32,
+                )
+                block_matches &= scores > FUZZY_SCORE
+
+            # FedEx receivers with at least one Extensiv receiver matching on all three fields
+            matched[block_rows] = block_matches.any(axis=1)
 
-            for extensiv_receiver in self.extensiv_receiver_lst:
-                extensiv_address: str = (str(extensiv_receiver["Receiver Address"]).lower().strip())  # fmt:skip
-                extensiv_name: str = str(extensiv_receiver["Receiver Name"]).lower().strip()  # fmt:skip
-                extensiv_company: str = (str(extensiv_receiver["Receiver Company"]).lower().strip())  # fmt:skip
+        # FedEx receivers are already deduplicated, so each matched row is a distinct receiver
+        for i in flatnonzero(matched):
 
-                address_score: float = fuzz.token_set_ratio(fedex_address, extensiv_address)  # fmt:skip
-                name_score: float = fuzz.token_set_ratio(fedex_name, extensiv_name)  # fmt:skip
-                company_score: float = fuzz.token_set_ratio(fedex_company, extensiv_company)  # fmt:skip
+            match_entry = {
+                "Address": raw_addresses[i],
+                "Name": raw_names[i],
+                "Company": raw_companies[i],
+                "Customer": self.name,
+            }
 
-                if (address_score > FUZZY_SCORE and name_score > FUZZY_SCORE and company_score > FUZZY_SCORE):
+            self.append_match(receiver_match=match_entry)
 
-                    match_entry = {
-                        "Address": fedex_receiver["Receiver Address"],
-                        "Name": fedex_receiver["Receiver Name"],
-                        "Company": fedex_receiver["Receiver Company"],
-                        "Customer": self.name,
-                    }
+            matched_addresses.append(match_entry["Address"])
+            matched_names.append(match_entry["Name"])
+            matched_companies.append(match_entry["Company"])
 
-                    if match_entry not in match_lst:
-                        self.append_match(receiver_match=match_entry)
-                        match_lst.append(match_entry)
+        return DataFrame({
+            "Address": matched_addresses,
+            "Name": matched_names,
+            "Company": matched_companies,
+            "Customer": [self.name] * len(matched_addresses),
+        })
 
-        return match_lst
 
+def run_for_customer(name: str, extensiv_table: DataFrame, fedex_invoice: DataFrame, reference_column_lst: list) -> tuple[DataFrame, DataFrame, str]:
+    """
+    Runs reference and receiver matching for a single customer's Extensiv table.
+    Defined at module level so it can be dispatched to worker processes.
 
-def make_final_df(reference_matches: list[dict[str, str]],receiver_matches: list[dict[str, str]],fedex_invoice: DataFrame) -> DataFrame:
+    Parameters:
+        - name: Customer name.
+        - extensiv_table: DataFrame containing the customer's Extensiv data.
+        - fedex_invoice: DataFrame with records where [Customer PO #] was not found in QuickBooks.
+        - reference_column_lst: List of FedEx Invoice columns to compare against Extensiv data.
+    Returns:
+        - A tuple containing the reference matches, receiver matches, and printable match summary.
+    """
+    customer_pattern_match = FindPatternMatches(name, extensiv_table, fedex_invoice)
+
+    reference_matches: DataFrame = customer_pattern_match.compare_references(reference_column_lst)
+    receiver_matches: DataFrame = customer_pattern_match.compare_receiver_info()
+
+    return reference_matches, receiver_matches, str(customer_pattern_match)
+
+
+def make_final_df(reference_matches: DataFrame, receiver_matches: DataFrame, fedex_invoice: DataFrame) -> DataFrame:
     """
     Updates the [Customer PO #] in fedex_invoice with the customer name if a match is found in Extensiv.
 
     Parameters:
-        - reference_matches: List of dictionaries with references found in Extensiv table.
-        - receiver_matches: List of dictionaries with receiver information found in Extensiv table.
+        - reference_matches: DataFrame with references found in Extensiv table.
+        - receiver_matches: DataFrame with receiver information found in Extensiv table.
         - fedex_invoice: DataFrame with records where [Customer PO #] was not found in QuickBooks.
     Returns:
         - Updated DataFrame with replaced [Customer PO #] values if a match is found.
+
+    Notes:
+        - Each match type becomes a dictionary lookup applied to the whole column with Series.map.
+        - Matches take priority in order: Reference, Receiver Address, Receiver Name, Receiver Company.
     """
-    final_df: DataFrame = fedex_invoice.copy()
-
-    final_matches_lst: list = []
-    final_matches_lst.extend(reference_matches)
-    final_matches_lst.extend(receiver_matches)
-
-    # Iterate through FedEx invoice
-    for i, row in final_df.iterrows():
-
-        fedex_reference = str(row["Reference"]).lower().strip()
-        fedex_receiver_address = str(row["Receiver Address"]).lower().strip()
-        fedex_receiver_name = str(row["Receiver Name"]).lower().strip()
-        fedex_receiver_company = str(row["Receiver Company"]).lower().strip()
-
-        # Iterate through each dictionary in master list
-        for dct in final_matches_lst:
-
-            extensiv_reference = str(dct["Reference"]).lower().strip() if "Reference" in dct else None 
-            extensiv_receiver_address = str(dct["Address"]).lower().strip() if "Address" in dct else None 
-            extensiv_receiver_name = str(dct["Name"]).lower().strip() if " Name" in dct else None 
-            extensiv_receiver_company = str(dct["Company"]).lower().strip() if "Company" in dct else None 
-
-            # Replace [Customer PO #] with customer name if match is found in Extensiv
-            if "Reference" in dct and extensiv_reference == fedex_reference:
-                final_df.loc[i, "Customer PO #"] = dct["Customer"]
-            elif "Address" in dct and extensiv_receiver_address == fedex_receiver_address: 
-                final_df.loc[i, "Customer PO #"] = dct["Customer"]
-            elif "Name" in dct and extensiv_receiver_name == fedex_receiver_name:
-                final_df.loc[i, "Customer PO #"] = dct["Customer"]
-            elif "Company" in dct and extensiv_receiver_company == fedex_receiver_company:
-                final_df.loc[i, "Customer PO #"] = dct["Customer"]
+    # Normalized Extensiv value -> customer name, one lookup per FedEx invoice column
+    lookups: dict[str, dict] = {
+        "Reference": dict(zip(normalize_strings(list(reference_matches["Reference"])), reference_matches["Customer"])),
+        "Receiver Address": dict(zip(normalize_strings(list(receiver_matches["Address"])), receiver_matches["Customer"])),
+        "Receiver Name": dict(zip(normalize_strings(list(receiver_matches["Name"])), receiver_matches["Customer"])),
+        "Receiver Company": dict(zip(normalize_strings(list(receiver_matches["Company"])), receiver_matches["Customer"])),
+    }
+
+    customer_names: Series = Series(index=fedex_invoice.index, dtype=object)
+
+    # Only rows still without a customer are filled by each lower priority lookup
+    for fedex_column, lookup in lookups.items():
+        mapped_names: Series = normalize_column(fedex_invoice[fedex_column]).map(lookup)
+        # where keeps object dtype; fillna would downcast an all-missing Series with a FutureWarning
+        customer_names = customer_names.where(customer_names.notna(), mapped_names)
+
+    # Replace [Customer PO #] with customer name if match is found in Extensiv
+    customer_po: Series = fedex_invoice["Customer PO #"].astype(object).mask(customer_names.notna(), customer_names)
+
+    # assign returns a new frame, so the caller's DataFrame is never mutated
+    final_df: DataFrame = fedex_invoice.assign(**{"Customer PO #": customer_po})
 
     return final_df
 
@@ -0,0 +1,363 @@
+"""==========================================================================================
+    
+    File:       pattern_match_tests.py
+    Description:
+        Contains the unit tests for pattern_match.py.
+
+    Dependencies:
+        External:
+            - unittest
+            - re
+            - rapidfuzz
+            - numpy
+            - pandas
+        Internal:
+            - pattern_match
+
+=========================================================================================="""
+
+import unittest
+from re import sub
+from unittest.mock import patch
+from numpy import nan
+from rapidfuzz import process
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from pattern_match import FindCustomerPO, FindPatternMatches, make_final_df, normalize_strings, reg_tokenizer
+
+"""====================================== Setup  ========================================="""
+
+
+class TestCompareQBO(unittest.TestCase):
+    """
+    Test cases to pin how compare_qbo splits FedEx records into found and not found in QBO.
+    """
+
+    def setUp(self):
+
+        self.qbo_key_lst = ["Fully_Qualified_Name", "Display_Name"]
+
+        self.qbo = DataFrame(
+            {
+                "Fully_Qualified_Name": ["PO-1", "PO-1", "PO-2", None],
+                "Display_Name": ["PO-1", "Other", "PO-1", None],
+            }
+        )
+
+        self.fedex_invoice = DataFrame(
+            {
+                "Customer PO #": ["PO-1", "PO-2", "PO-3", None],
+                "Tracking #": [1, 2, 3, 4],
+            }
+        )
+
+    """=============================== Test compare_qbo ==================================="""
+
+    def test_found_rows_not_repeated(self):
+
+        qbo_found, _ = FindCustomerPO(self.qbo, self.fedex_invoice).compare_qbo(self.qbo_key_lst)
+
+        self.assertEqual(list(qbo_found["Tracking #"]), [1, 2])
+
+    def test_missing_keys_do_not_join(self):
+
+        _, qbo_not_found = FindCustomerPO(self.qbo, self.fedex_invoice).compare_qbo(self.qbo_key_lst)
+
+        self.assertEqual(list(qbo_not_found["Tracking #"]), [3, 4])
+
+    def test_fedex_columns_only(self):
+
+        qbo_found, qbo_not_found = FindCustomerPO(self.qbo, self.fedex_invoice).compare_qbo(self.qbo_key_lst)
+
+        self.assertEqual(list(qbo_found.columns), ["Customer PO #", "Tracking #"])
+        self.assertEqual(list(qbo_not_found.columns), ["Customer PO #", "Tracking #"])
+
+    def test_reference_sets(self):
+
+        qbo_pattern_match = FindCustomerPO(self.qbo, self.fedex_invoice)
+        qbo_pattern_match.compare_qbo(self.qbo_key_lst)
+
+        self.assertEqual(qbo_pattern_match.found_references_unique, {"PO-1", "PO-2"})
+        self.assertEqual(qbo_pattern_match.unmatched_references, {"PO-3"})
+
+
+class TestRegTokenizer(unittest.TestCase):
+    """
+    Test cases to pin that reg_tokenizer builds the same patterns as the original three-pass substitution.
+    """
+
+    def three_pass_tokenizer(self, value):
+
+        with_letters = sub(r"[a-zA-Z]+", r"\\w+", str(value))
+        with_numbers = sub(r"\d+(\.\d+)?", r"\\d+(\\.\\d+)?", with_letters)
+        with_spaces = sub(r"\s+", r"\\s+", with_numbers)
+
+        return with_spaces
+
+    def assert_same_pattern(self, value):
+
+        self.assertEqual(reg_tokenizer(value).pattern, self.three_pass_tokenizer(value))
+
+    """================================ Test reg_tokenizer ================================"""
+
+    def test_digits(self):
+
+        self.assert_same_pattern("12345")
+        self.assert_same_pattern("12.5")
+        self.assert_same_pattern(12.5)
+
+    def test_letters(self):
+
+        self.assert_same_pattern("ABC")
+
+    def test_mixed(self):
+
+        self.assert_same_pattern("PO-12 AB")
+        self.assert_same_pattern("A1.5b-2")
+
+    def test_whitespace_runs(self):
+
+        self.assert_same_pattern("AB  12\t C")
+
+    def test_non_ascii(self):
+
+        # Non-ASCII digits and letters must skip the single-class shortcut
+        self.assert_same_pattern("١٢٣")
+        self.assert_same_pattern("café")
+        self.assertEqual(reg_tokenizer("café").pattern, r"\w+é")
+
+
+class TestCompareReferences(unittest.TestCase):
+    """
+    Test cases to pin how compare_references matches FedEx references to Extensiv values.
+    """
+
+    def setUp(self):
+
+        self.reference_column_lst = ["Reference", "Reference 2"]
+
+        self.extensiv_table = DataFrame(
+            {
+                "PO": ["AB-99", " PO-12 "],
+                "Notes": ["x", nan],
+            }
+        )
+
+    def reference_matches(self, references, references_2):
+
+        fedex_invoice = DataFrame({"Reference": references, "Reference 2": references_2})
+        customer_pattern_match = FindPatternMatches("Acme", self.extensiv_table, fedex_invoice)
+
+        return customer_pattern_match.compare_references(self.reference_column_lst)
+
+    """============================ Test compare_references ==============================="""
+
+    def test_fuzzy_name_match(self):
+
+        # ACME-77 is not an Extensiv value, but it contains the customer name
+        with patch("pattern_match.normalize_strings", wraps=normalize_strings) as normalize:
+            reference_matches = self.reference_matches(["ACME-77"], [None])
+
+        normalize.assert_not_called()
+        self.assertEqual(list(reference_matches["Reference"]), ["ACME-77"])
+        self.assertEqual(list(reference_matches["Column"]), ["PO"])
+        self.assertEqual(list(reference_matches["Customer"]), ["Acme"])
+
+    def test_exact_match_ignores_case_and_whitespace(self):
+
+        reference_matches = self.reference_matches(["po-12"], [None])
+
+        self.assertEqual(list(reference_matches["Reference"]), ["po-12"])
+        self.assertEqual(list(reference_matches["Column"]), ["PO"])
+
+    def test_reference_in_two_columns_reported_once(self):
+
+        reference_matches = self.reference_matches(["PO-12"], ["PO-12"])
+
+        self.assertEqual(list(reference_matches["Reference"]), ["PO-12"])
+
+    def test_missing_and_repeated_references_skipped(self):
+
+        # A missing reference stringified to 'nan' would match the missing Notes value
+        reference_matches = self.reference_matches([nan, "PO-12", "PO-12"], [nan, nan, nan])
+
+        self.assertEqual(list(reference_matches["Reference"]), ["PO-12"])
+
+    def test_no_match(self):
+
+        reference_matches = self.reference_matches(["ZZ-1"], [None])
+
+        self.assertTrue(reference_matches.empty)
+
+
+class TestCompareReceiverInfo(unittest.TestCase):
+    """
+    Test cases to pin how compare_receiver_info fuzzy matches FedEx receivers to Extensiv receivers.
+    """
+
+    def setUp(self):
+
+        self.extensiv_table = DataFrame(
+            {
+                "ShipTo.Address1": ["1 Main Street", "3 Elm Road"],
+                "ShipTo.CompanyName": ["Acme Inc", "Initech LLC"],
+                "ShipTo.Name": ["Jane M Doe", "Samuel Poe"],
+            }
+        )
+
+        self.fedex_invoice = DataFrame(
+            {
+                "Receiver Address": ["3 Elm Rd", "1 Main St", "1 Main St"],
+                "Receiver Company": ["Initech", "Globex", "Acme"],
+                "Receiver Name": ["Sam Poe", "Jane Doe", "Jane Doe"],
+            }
+        )
+
+    def receiver_matches(self, block_size=None):
+
+        customer_pattern_match = FindPatternMatches("Customer", self.extensiv_table, self.fedex_invoice)
+
+        return customer_pattern_match.compare_receiver_info(block_size)
+
+    """============================ Test compare_receiver_info ============================"""
+
+    def test_all_fields_match(self):
+
+        receiver_matches = self.receiver_matches()
+
+        self.assertIn("Acme", list(receiver_matches["Company"]))
+        self.assertIn("Initech", list(receiver_matches["Company"]))
+
+    def test_two_fields_do_not_match(self):
+
+        # Address and Name score above 70, but Globex against Acme Inc does not
+        receiver_matches = self.receiver_matches()
+
+        self.assertNotIn("Globex", list(receiver_matches["Company"]))
+
+    def test_match_order_follows_fedex(self):
+
+        receiver_matches = self.receiver_matches()
+
+        self.assertEqual(list(receiver_matches["Address"]), ["3 Elm Rd", "1 Main St"])
+        self.assertEqual(list(receiver_matches["Customer"]), ["Customer", "Customer"])
+
+    def test_block_boundary(self):
+
+        assert_frame_equal(self.receiver_matches(block_size=1), self.receiver_matches())
+        assert_frame_equal(self.receiver_matches(block_size=2), self.receiver_matches())
+
+    """============================= Test exact-match prefilter ==========================="""
+
+    def test_identical_receiver_not_scored(self):
+
+        self.fedex_invoice = DataFrame(
+            {
+                "Receiver Address": ["1 Main Street"],
+                "Receiver Company": ["Acme Inc"],
+                "Receiver Name": ["Jane M Doe"],
+            }
+        )
+
+        with patch("pattern_match.process.cdist", wraps=process.cdist) as cdist:
+            receiver_matches = self.receiver_matches()
+
+        cdist.assert_not_called()
+        self.assertEqual(list(receiver_matches["Address"]), ["1 Main Street"])
+
+    def test_identical_receiver_with_empty_field_scored(self):
+
+        # token_set_ratio scores two empty strings 0, so an empty field must not be prefiltered as a match
+        self.extensiv_table = DataFrame(
+            {
+                "ShipTo.Address1": ["4 Pine Court"],
+                "ShipTo.CompanyName": [""],
+                "ShipTo.Name": ["Pat Roe"],
+            }
+        )
+        self.fedex_invoice = DataFrame(
+            {
+                "Receiver Address": ["4 Pine Court"],
+                "Receiver Company": [""],
+                "Receiver Name": ["Pat Roe"],
+            }
+        )
+
+        with patch("pattern_match.process.cdist", wraps=process.cdist) as cdist:
+            receiver_matches = self.receiver_matches()
+
+        cdist.assert_called()
+        self.assertTrue(receiver_matches.empty)
+
+
+class TestMakeFinalDF(unittest.TestCase):
+    """
+    Test cases to pin how make_final_df assigns customer names to unmatched FedEx records.
+    """
+
+    def setUp(self):
+
+        self.fedex_invoice = DataFrame(
+            {
+                "Customer PO #": ["PO-1", "PO-2", "PO-3"],
+                "Reference": ["REF-1", "REF-2", "REF-3"],
+                "Receiver Address": ["1 Main St", "2 Oak Ave", "3 Elm Rd"],
+                "Receiver Name": ["Jane Doe", "John Roe", "Sam Poe"],
+                "Receiver Company": ["Acme", "Globex", "Initech"],
+            }
+        )
+
+        self.no_references = DataFrame(columns=["Reference", "Column", "Customer"])
+        self.no_receivers = DataFrame(columns=["Address", "Name", "Company", "Customer"])
+
+    def receiver_match(self, address="", name="", company="", customer=""):
+
+        return DataFrame({"Address": [address], "Name": [name], "Company": [company], "Customer": [customer]})
+
+    """============================== Test match priority ================================="""
+
+    def test_reference_beats_receiver(self):
+
+        reference_matches = DataFrame({"Reference": ["ref-1"], "Column": ["PO"], "Customer": ["Reference Customer"]})
+        receiver_matches = self.receiver_match(address="1 Main St", customer="Receiver Customer")
+
+        final_df = make_final_df(reference_matches, receiver_matches, self.fedex_invoice)
+
+        self.assertEqual(final_df.loc[0, "Customer PO #"], "Reference Customer")
+
+    def test_receiver_name_match(self):
+
+        receiver_matches = self.receiver_match(name="john roe ", customer="Name Customer")
+
+        final_df = make_final_df(self.no_references, receiver_matches, self.fedex_invoice)
+
+        self.assertEqual(final_df.loc[1, "Customer PO #"], "Name Customer")
+
+    def test_unmatched_rows_keep_po(self):
+
+        receiver_matches = self.receiver_match(company="Initech", customer="Company Customer")
+
+        final_df = make_final_df(self.no_references, receiver_matches, self.fedex_invoice)
+
+        self.assertEqual(list(final_df["Customer PO #"]), ["PO-1", "PO-2", "Company Customer"])
+
+    def test_input_not_mutated(self):
+
+        receiver_matches = self.receiver_match(address="2 Oak Ave", customer="Address Customer")
+
+        make_final_df(self.no_references, receiver_matches, self.fedex_invoice)
+
+        self.assertEqual(list(self.fedex_invoice["Customer PO #"]), ["PO-1", "PO-2", "PO-3"])
+
+    def test_no_matches(self):
+
+        final_df = make_final_df(self.no_references, self.no_receivers, self.fedex_invoice)
+
+        self.assertEqual(list(final_df["Customer PO #"]), ["PO-1", "PO-2", "PO-3"])
+
+    """=========================================================================================="""
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,25 +27,28 @@ def convert_floats2ints(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns:
         - df: DataFrame with appropriate float columns converted to integers
-    """
-    df = df.copy()
 
+    Notes:
+        - The input is never modified. When no column is converted the input DataFrame itself is
+          returned, otherwise a converted copy.
+    """
     float_cols = df.select_dtypes(include="float64")
 
     if float_cols.empty:
         return df
 
-    convertible_cols = []
-    for col in float_cols.columns:
-        non_null_values = df[col].dropna()
-        if non_null_values.empty:
-            continue
-        if np.all(non_null_values == non_null_values.astype(int)):
-            convertible_cols.append(col)
+    # Whole-number test for every float column in one pass over the 2-D block; missing values
+    # are ignored, and infinities or values outside the Int64 range are never convertible
+    values = float_cols.to_numpy()
+    missing = np.isnan(values)
+    fractional, _ = np.modf(values)
+    whole = missing | (np.isfinite(values) & (fractional == 0) & (np.abs(values) < 2**63))
 
-    if convertible_cols:
-        df[convertible_cols] = df[convertible_cols].apply(
-            lambda x: x.astype("Int64") if not x.isna().all() else x
-        )
+    # Columns with only missing values are left as floats
+    convertible_cols = float_cols.columns[whole.all(axis=0) & ~missing.all(axis=0)]
+
+    if convertible_cols.empty:
+        return df
 
-    return df
+    # astype returns a new DataFrame, so the copy is only paid when something is converted
+    return df.astype({col: "Int64" for col in convertible_cols})
@@ -0,0 +1,98 @@
+"""==========================================================================================
+
+    File:       processing_tests.py
+    Description:
+        Contains the unit tests for processing.py.
+
+    Dependencies:
+        External:
+            - unittest
+            - numpy
+            - pandas
+        Internal:
+            - processing
+
+=========================================================================================="""
+
+import unittest
+from numpy import nan, inf
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from processing import convert_floats2ints
+
+"""====================================== Setup  ========================================="""
+
+
+class TestConvertFloats2Ints(unittest.TestCase):
+    """
+    Test cases to pin which float columns convert_floats2ints casts to Int64.
+    """
+
+    def setUp(self):
+
+        self.df = DataFrame(
+            {
+                "Whole": [1.0, nan, 3.0],
+                "Missing": [nan, nan, nan],
+                "Fractional": [1.0, 2.5, 3.0],
+                "Infinite": [1.0, inf, 3.0],
+                "Too Large": [1.0, 1e19, 3.0],
+                "Text": ["a", "b", "c"],
+            }
+        )
+
+    """============================ Test convert_floats2ints =============================="""
+
+    def test_whole_numbers_with_nan(self):
+
+        converted = convert_floats2ints(self.df)
+
+        self.assertEqual(converted["Whole"].dtype, "Int64")
+        self.assertEqual(list(converted["Whole"].isna()), [False, True, False])
+        self.assertEqual(list(converted["Whole"].dropna()), [1, 3])
+
+    def test_all_missing_stays_float(self):
+
+        converted = convert_floats2ints(self.df)
+
+        self.assertEqual(converted["Missing"].dtype, "float64")
+
+    def test_fractional_stays_float(self):
+
+        converted = convert_floats2ints(self.df)
+
+        self.assertEqual(converted["Fractional"].dtype, "float64")
+
+    def test_out_of_range_stays_float(self):
+
+        converted = convert_floats2ints(self.df)
+
+        self.assertEqual(converted["Infinite"].dtype, "float64")
+        self.assertEqual(converted["Too Large"].dtype, "float64")
+
+    def test_other_columns_unchanged(self):
+
+        converted = convert_floats2ints(self.df)
+
+        self.assertEqual(converted["Text"].dtype, object)
+
+    def test_input_not_mutated(self):
+
+        original = self.df.copy()
+
+        convert_floats2ints(self.df)
+
+        assert_frame_equal(self.df, original)
+
+    def test_nothing_converted(self):
+
+        df = self.df[["Fractional", "Text"]]
+
+        self.assertIs(convert_floats2ints(df), df)
+
+    """=========================================================================================="""
+
+
+if __name__ == "__main__":
+    unittest.main()